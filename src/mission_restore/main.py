@@ -10,195 +10,608 @@ import re
 import sys
 import os
 import argparse
+import hashlib
+import mmap
+import stat
+import itertools
+from collections.abc import Iterable, Iterator
 
 # --- CLI 출력 헬퍼 함수 ---
 # 이 함수들은 스크립트의 모든 터미널 출력을 일관된 형식으로 만들어줍니다.
 # 이를 통해 사용자에게 현재 진행 상황을 명확하고 전문적으로 전달할 수 있습니다.
-def print_info(message: str): print(f"[  INFO   ] {message}")
-def print_step(message: str): print(f"[ STEP {message}")
-def print_ok(message: str): print(f"[   OK    ] {message}")
-def print_progress(message: str): print(f"[   ...   ] {message}")
-def print_success(message: str): print(f"[ SUCCESS ] {message}")
-def print_error(message: str): print(f"[  ERROR  ] {message}")
-def print_failed(message: str): print(f"[ FAILED  ] {message}")
+# 패치마다 출력되는 진행 메시지(print_progress)는 곧바로 쓰지 않고 모아두었다가
+# _PROGRESS_FLUSH_INTERVAL개마다 한 번의 write로 출력합니다. 다른 헬퍼는 출력 전에
+# 모아둔 진행 메시지를 먼저 내보내므로, 메시지의 순서는 항상 그대로 유지됩니다.
+_PROGRESS_FLUSH_INTERVAL = 64
+_pending_progress: list[str] = []
+
+def _flush_progress() -> None:
+    if _pending_progress:
+        sys.stdout.write("\n".join(_pending_progress) + "\n")
+        _pending_progress.clear()
+
+def _print_line(line: str) -> None:
+    _flush_progress()
+    print(line)
+
+def print_info(message: str): _print_line(f"[  INFO   ] {message}")
+def print_step(message: str): _print_line(f"[ STEP {message}")
+def print_ok(message: str): _print_line(f"[   OK    ] {message}")
+def print_success(message: str): _print_line(f"[ SUCCESS ] {message}")
+def print_warning(message: str): _print_line(f"[ WARNING ] {message}")
+def print_error(message: str): _print_line(f"[  ERROR  ] {message}")
+def print_failed(message: str): _print_line(f"[ FAILED  ] {message}")
+
+def print_progress(message: str):
+    _pending_progress.append(f"[   ...   ] {message}")
+    if len(_pending_progress) >= _PROGRESS_FLUSH_INTERVAL:
+        _flush_progress()
 # -------------------------
 
-def parse_log_file(log_content: str) -> tuple[str, list[str]] | tuple[None, None]:
+# --- 로그 블록 구분자 ---
+# 로그 파일은 '🦊==='로 시작하는 헤더 라인으로 각 블록이 구분됩니다.
+# 파싱은 이 구분자로 한 번만 나눈 뒤 블록의 접두어로 종류를 판별하는 선형 스캔이며,
+# 백트래킹이 발생하는 정규식을 사용하지 않습니다.
+_BLOCK_MARKER = "🦊==="
+_INITIAL_BLOCK_PREFIX = " Initial version of "
+_DIFF_BLOCK_PREFIX = " Code changes at"
+# diff 블록 헤더 바로 다음 두 라인. 예전 정규식(`\s*`)과 같이 라인 끝의 공백은 허용합니다.
+_DIFF_OLD_HEADER = "--- previous version"
+_DIFF_NEW_HEADER = "+++ current version"
+# 이 크기 이상의 로그 파일은 전체를 메모리에 올리지 않고 라인 단위로 스트리밍하며 복원합니다.
+_STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# --- 정규식 패턴 (모듈 로드 시 한 번만 컴파일) ---
+# hunk마다 반복되는 re 모듈의 캐시 조회와 플래그 해석 비용을 없애기 위해 미리 컴파일합니다.
+_HUNK_HEADER_RE = re.compile(r"@@ -(\d+),?(\d*) \+(\d+),?(\d*)")
+# hunk 본문의 연산자 문자열(' ', '+', '-' 등)에서 같은 문자가 연속되는 구간을 찾습니다.
+_OP_RUN_RE = re.compile(r"(.)\1*", re.DOTALL)
+# -------------------------
+
+# --- 파싱 결과 캐시 ---
+# 한 프로세스 안에서 `restore_code_from_log`를 같은 로그로 반복 호출하는 경우(테스트/CI 루프 등)
+# 파싱 단계를 건너뛰기 위해, 로그 내용의 해시를 키로 `parse_log_file`의 결과를 보관합니다.
+# 명령줄에서 한 번 실행하는 경우에는 캐시가 적중할 일이 없습니다.
+# 장시간 실행되는 프로세스에서 메모리가 계속 늘어나지 않도록 최근 항목만 유지합니다.
+_PARSE_CACHE: dict[bytes, tuple[list[str], list[str]]] = {}
+_PARSE_CACHE_MAX_ENTRIES = 8
+# -------------------------
+
+class LogFormatError(ValueError):
+    """로그 파일의 블록 구조가 예상한 형식과 다를 때 발생하는 예외입니다."""
+
+def _initial_code_from_block(block: str) -> str:
+    """
+    'Initial version' 블록에서 헤더 라인을 제외한 초기 코드를 꺼냅니다.
+
+    Args:
+        block (str): 구분자('🦊===') 바로 뒤부터 시작하는 블록의 내용.
+
+    Returns:
+        str: 초기 코드. 헤더만 있고 코드가 없으면 빈 문자열입니다.
+    """
+    header_end = block.find('\n')
+    if header_end == -1:
+        # 헤더는 있으나 코드가 비어있는 경우, 빈 문자열로 처리합니다.
+        return ""
+    # ★★★ 핵심 안정성 로직 ★★★
+    # 헤더 바로 다음의 불필요한 개행 문자를 lstrip으로 제거합니다.
+    # 이 개행이 남아있으면 전체 코드의 줄 번호(인덱스)가 1씩 밀려,
+    # 이후 diff 적용 시 '컨텍스트 불일치' 오류를 유발하므로 반드시 제거해야 합니다.
+    return block[header_end + 1:].lstrip('\n')
+
+def _diff_from_block(block: str) -> str:
+    """
+    'Code changes' 블록에서 '--- previous version / +++ current version' 헤더 이후의 diff 내용을 꺼냅니다.
+
+    블록 헤더 라인 바로 다음 두 라인이 diff 헤더여야 하며, 각 라인 끝의 공백은 무시합니다.
+
+    Args:
+        block (str): 구분자('🦊===') 바로 뒤부터 시작하는 블록의 내용.
+
+    Returns:
+        str: diff 내용. diff 헤더 뒤에 내용이 없으면 빈 문자열입니다.
+
+    Raises:
+        LogFormatError: 블록에 diff 헤더가 없는 경우. 패치를 조용히 건너뛰면
+                        잘못된 코드가 '성공'으로 복원되므로 반드시 오류로 처리합니다.
+    """
+    lines = block.split('\n', 3)
+    if (len(lines) < 3
+            or lines[1].rstrip() != _DIFF_OLD_HEADER
+            or lines[2].rstrip() != _DIFF_NEW_HEADER):
+        raise LogFormatError(
+            f"diff 헤더('{_DIFF_OLD_HEADER}' / '{_DIFF_NEW_HEADER}')가 없는 변경 기록 블록입니다: "
+            f"'{_BLOCK_MARKER}{lines[0]}'"
+        )
+    return lines[3] if len(lines) == 4 else ""
+
+def parse_log_file(log_content: str) -> tuple[list[str], list[str]] | tuple[None, None]:
     """
     로그 파일의 전체 문자열 내용을 받아 '초기 코드'와 'diff 블록 리스트'를 분리합니다.
 
-    이 함수는 정규식을 사용하여 두 가지 주요 정보를 추출하며, CLI 출력은 하지 않습니다.
+    이 함수는 다음 두 가지 주요 정보를 추출하며, CLI 출력은 하지 않습니다.
     1.  '🦊=== Initial version of ... ==='로 시작하는 블록의 내용 (초기 코드)
     2.  '--- previous version'과 '+++ current version'으로 구분되는 모든 diff 블록
 
+    로그 전체를 '\n🦊===' 구분자로 한 번만 나누고, 각 블록의 접두어로 종류를 판별합니다.
+    정규식 백트래킹이 없는 O(N) 단일 패스이므로 큰 로그 파일에서도 처리 시간이 선형으로 증가합니다.
+
     Args:
         log_content (str): 읽어온 로그 파일의 전체 내용.
 
     Returns:
         성공 시:
-            tuple[str, list[str]]: 첫 번째 요소는 초기 코드 문자열,
-                                  두 번째 요소는 추출된 diff 블록들의 리스트.
+            tuple[list[str], list[str]]: 첫 번째 요소는 라인 단위로 분리된 초기 코드,
+                                        두 번째 요소는 추출된 diff 블록들의 리스트.
         실패 시 (초기 버전 블록을 찾지 못한 경우):
             tuple[None, None]: 두 요소 모두 None을 반환하여 파싱 실패를 알립니다.
+
+    Raises:
+        LogFormatError: diff 헤더가 없는 'Code changes' 블록이 있는 경우.
     """
-    # 1. 초기 버전 코드 추출
-    # re.DOTALL 플래그를 사용하여 '.'이 개행문자(\n)도 포함하도록 합니다.
-    # `(?=\n🦊=== Code changes at|$)`는 비-캡처 긍정형 전방탐색(non-capturing positive lookahead)으로,
-    # 다음에 'Code changes' 블록이 나오거나 파일의 끝이 나오기 직전까지를 매칭 범위로 한정합니다.
-    initial_version_match = re.search(
-        r"🦊=== Initial version of .*? ===\n(.*?)(?=\n🦊=== Code changes at|$)",
-        log_content,
-        re.DOTALL
-    )
-    
-    # 초기 버전 블록 자체가 없는 치명적인 경우
-    if not initial_version_match:
-        # 헤더는 있지만 내용이 없는 경우를 대비해 헤더 존재 여부만으로 한 번 더 확인합니다.
-        initial_version_header_match = re.search(r"🦊=== Initial version of .*? ===", log_content)
-        if not initial_version_header_match:
-            # 헤더조차 찾을 수 없으면, 복원을 진행할 수 없으므로 None을 반환합니다.
-            return None, None
-        # 헤더는 있으나 코드가 비어있는 경우, 빈 문자열로 처리합니다.
-        initial_code = "" 
+    # 파일 끝의 개행 하나는 마지막 블록의 내용에 포함하지 않습니다.
+    if log_content.endswith('\n'):
+        log_content = log_content[:-1]
+
+    # 각 블록은 구분자('🦊===') 바로 뒤의 텍스트로 시작합니다.
+    # 로그가 구분자로 시작하지 않으면, 첫 번째 조각은 블록이 아닌 머리말이므로 건너뜁니다.
+    blocks = log_content.split('\n' + _BLOCK_MARKER)
+    if blocks[0].startswith(_BLOCK_MARKER):
+        blocks[0] = blocks[0][len(_BLOCK_MARKER):]
     else:
-        initial_code_raw = initial_version_match.group(1)
-        # ★★★ 핵심 안정성 로직 ★★★
-        # 정규식 캡처 시, 헤더 바로 다음의 불필요한 개행 문자를 lstrip으로 제거합니다.
-        # 이 개행이 남아있으면 전체 코드의 줄 번호(인덱스)가 1씩 밀려,
-        # 이후 diff 적용 시 '컨텍스트 불일치' 오류를 유발하므로 반드시 제거해야 합니다.
-        initial_code = initial_code_raw.lstrip('\n') if initial_code_raw is not None else ""
-
-    # 2. 모든 diff 블록 추출
-    # re.compile을 사용하여 정규식 패턴을 미리 컴파일해두면, 반복 사용 시 약간의 성능 향상이 있습니다.
-    pattern = re.compile(
-        r"--- previous version\s*\n\+\+\+ current version\s*\n(.*?)(?=\n🦊===|$)",
-        re.DOTALL
-    )
-    # findall을 사용하여 매칭되는 모든 diff 내용을 리스트로 가져옵니다.
-    diffs = pattern.findall(log_content)
-    
-    return initial_code, diffs
+        blocks = blocks[1:]
+
+    initial_code = None
+    diffs = []
+    for block in blocks:
+        if block.startswith(_DIFF_BLOCK_PREFIX):
+            # 2. diff 블록
+            diffs.append(_diff_from_block(block))
+        elif initial_code is None and block.startswith(_INITIAL_BLOCK_PREFIX):
+            # 1. 초기 버전 블록
+            initial_code = _initial_code_from_block(block)
+
+    # 헤더조차 찾을 수 없으면, 복원을 진행할 수 없으므로 None을 반환합니다.
+    if initial_code is None:
+        return None, None
+
+    # 초기 코드는 여기서 한 번만 라인 리스트로 분리되며, 이후 단계에서는 다시 나누지 않습니다.
+    return initial_code.split('\n'), diffs
+
+def _parse_log_file_cached(log_content: str, key: bytes) -> tuple[list[str], list[str]] | tuple[None, None]:
+    """
+    로그 내용의 해시를 키로 `parse_log_file`의 결과를 캐시하여 반환합니다.
 
-def apply_single_diff_robust(source_code: str, diff_content: str) -> str | None:
+    `parse_log_file`은 입력에만 의존하는 순수 함수이고, 이후 단계는 반환된 리스트를
+    수정하지 않으므로 같은 결과 객체를 그대로 재사용해도 안전합니다.
+    파싱에 실패한 결과(None)는 캐시하지 않습니다.
+    캐시는 한 프로세스 안에서 `restore_code_from_log`를 반복 호출할 때만 적중합니다.
+
+    Args:
+        log_content (str): 읽어온 로그 파일의 전체 내용.
+        key (bytes): 로그 원본 바이트의 해시 (`_read_log_file`이 함께 반환한 값).
+
+    Returns:
+        `parse_log_file`과 동일합니다.
     """
-    단일 diff 덩어리(patch)를 원본 소스 코드에 적용합니다.
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    initial_code_lines, diffs = parse_log_file(log_content)
+    if initial_code_lines is None or diffs is None:
+        return None, None
+
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX_ENTRIES:
+        # dict는 삽입 순서를 유지하므로, 가장 먼저 추가된 항목을 제거합니다.
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+    _PARSE_CACHE[key] = (initial_code_lines, diffs)
+    return initial_code_lines, diffs
+
+def _iter_log_blocks(log_lines: Iterable[str]) -> Iterator[str]:
+    """
+    로그를 라인 단위로 읽으며, 구분자('🦊===') 뒤의 블록 내용을 하나씩 생성합니다.
+
+    `parse_log_file`이 '\n🦊==='로 나눈 결과와 같은 블록을 만들되, 한 번에
+    하나의 블록만 메모리에 보관합니다. 첫 구분자 이전의 머리말은 건너뜁니다.
+
+    Args:
+        log_lines (Iterable[str]): 줄바꿈 문자('\n')를 포함한 로그의 각 라인.
+
+    Yields:
+        str: 구분자 바로 뒤부터, 다음 구분자 앞의 개행 직전까지의 블록 내용.
+    """
+    block_lines = None
+    for line in log_lines:
+        if line.startswith(_BLOCK_MARKER):
+            if block_lines is not None:
+                yield _join_block_lines(block_lines)
+            block_lines = [line[len(_BLOCK_MARKER):]]
+        elif block_lines is not None:
+            block_lines.append(line)
+    if block_lines is not None:
+        yield _join_block_lines(block_lines)
+
+def _join_block_lines(block_lines: list[str]) -> str:
+    """블록의 라인들을 합치고, 다음 구분자(또는 파일 끝) 직전의 개행 하나를 제거합니다."""
+    block = "".join(block_lines)
+    return block[:-1] if block.endswith('\n') else block
+
+def _iter_block_diffs(blocks: Iterator[str]) -> Iterator[str]:
+    """남은 블록들 중 'Code changes' 블록의 diff 내용만 차례로 생성합니다."""
+    for block in blocks:
+        if block.startswith(_DIFF_BLOCK_PREFIX):
+            yield _diff_from_block(block)
+
+def parse_log_stream(log_file: Iterable[str]) -> tuple[list[str], Iterator[str]] | tuple[None, None]:
+    """
+    로그 파일을 라인 단위로 스트리밍하며 '초기 코드'와 'diff 이터레이터'를 분리합니다.
+
+    `parse_log_file`과 같은 결과를 내지만 로그 전체를 문자열로 읽어들이지 않습니다.
+    초기 버전 블록까지만 먼저 읽고, 이후의 diff들은 반환된 이터레이터를 소비할 때
+    하나씩 읽어오므로 메모리 사용량은 로그 크기와 무관하게 diff 하나 분량으로 유지됩니다.
+    이터레이터를 모두 소비할 때까지 `log_file`은 열린 상태여야 합니다.
+
+    Args:
+        log_file: 텍스트 모드로 연 로그 파일 객체 등, '\n'으로 끝나는 라인들을 내놓는 이터러블.
+                  줄바꿈은 LF(\n)로 통일되어 있어야 합니다 (텍스트 모드의 기본 동작).
+
+    Returns:
+        성공 시:
+            tuple[list[str], Iterator[str]]: 라인 단위로 분리된 초기 코드와,
+                                             diff 내용을 순서대로 내놓는 이터레이터.
+        실패 시 (초기 버전 블록을 찾지 못한 경우):
+            tuple[None, None]: 두 요소 모두 None을 반환하여 파싱 실패를 알립니다.
+
+    Raises:
+        LogFormatError: diff 헤더가 없는 'Code changes' 블록이 있는 경우.
+                        초기 버전 블록 이후의 블록에서는 반환된 이터레이터를 소비할 때 발생합니다.
+    """
+    blocks = _iter_log_blocks(log_file)
+    # 초기 버전 블록보다 앞에 기록된 diff가 있다면, 순서를 지키기 위해 보관해 두었다가 먼저 내보냅니다.
+    leading_diffs = []
+    for block in blocks:
+        if block.startswith(_DIFF_BLOCK_PREFIX):
+            leading_diffs.append(_diff_from_block(block))
+        elif block.startswith(_INITIAL_BLOCK_PREFIX):
+            initial_code = _initial_code_from_block(block)
+            return initial_code.split('\n'), itertools.chain(leading_diffs, _iter_block_diffs(blocks))
+
+    # 헤더조차 찾을 수 없으면, 복원을 진행할 수 없으므로 None을 반환합니다.
+    return None, None
+
+def _iter_hunks(diff_content: str) -> Iterator[tuple[str, list[str]]]:
+    """
+    '@@'로 시작하는 diff 내용을 (hunk 헤더, hunk 본문) 쌍으로 차례로 생성합니다.
+
+    hunk 헤더는 항상 새 라인의 시작에 오므로, diff 전체를 '\n@@' 기준으로 나누면
+    hunk 경계를 라인별 파이썬 루프 없이 C 레벨의 str.split 한 번으로 찾을 수 있습니다.
+    라인 분리도 각 hunk 본문에 대해서만 수행합니다.
+
+    Args:
+        diff_content (str): '@@'로 시작하는 diff 내용 (unified diff format).
+
+    Yields:
+        tuple[str, list[str]]: hunk 헤더 라인과, 다음 헤더 직전까지의 본문 라인 리스트.
+    """
+    for i, chunk in enumerate(diff_content.split('\n@@')):
+        header_end = chunk.find('\n')
+        if header_end == -1:
+            header, body = chunk, []
+        else:
+            header, body = chunk[:header_end], chunk[header_end + 1:].split('\n')
+        # 첫 번째 조각을 제외하면 split 구분자에 포함된 '@@'를 헤더에 되돌려 붙입니다.
+        yield (header if i == 0 else "@@" + header), body
+
+def _print_line_mismatch(kind: str, source_lines: list[str], source_pointer: int, expected: list[str]) -> None:
+    """
+    컨텍스트/삭제 구간의 슬라이스 비교가 실패했을 때, 처음으로 어긋난 라인을 찾아 출력합니다.
+
+    Args:
+        kind (str): 오류 메시지에 표시할 라인 종류 ('컨텍스트' 또는 '삭제할 라인').
+        source_lines (list[str]): 비교 대상인 원본 코드의 라인 리스트.
+        source_pointer (int): 비교를 시작한 원본 코드의 위치 (0부터 시작).
+        expected (list[str]): diff에 기록된, 원본에 있어야 할 라인들.
+    """
+    for line_content in expected:
+        if source_pointer >= len(source_lines) or source_lines[source_pointer] != line_content:
+            break
+        source_pointer += 1
+    print_error(f"치명적 오류: {kind} 불일치 발생!")
+    print(f"             - 예상된 소스({source_pointer+1}): '{line_content}'")
+    print(f"             - 실제 소스({source_pointer+1}): '{source_lines[source_pointer] if source_pointer < len(source_lines) else 'EOF'}'")
+
+def _apply_single_diff_lines(source_lines: list[str], diff_content: str) -> list[str] | None:
+    """
+    단일 diff 덩어리(patch)를 라인 리스트 형태의 원본 코드에 적용합니다.
 
     이 함수는 'patch' 유틸리티와 유사하게 동작하며, 특히 안정성에 중점을 둡니다.
     - 여러 개의 수정 묶음(hunk)을 처리할 수 있습니다.
     - 컨텍스트 라인(context line, ' '로 시작)을 원본과 비교하여 diff가 정확한 위치에
       적용되는지 검증합니다. 불일치 시, 복원을 중단하고 None을 반환합니다.
 
+    여러 diff를 연속으로 적용할 때 매번 문자열로 합쳤다가 다시 나누지 않도록,
+    입력과 출력 모두 라인 리스트를 사용합니다. 전달받은 리스트는 수정하지 않습니다.
+
     Args:
-        source_code (str): diff를 적용할 원본 코드.
+        source_lines (list[str]): diff를 적용할 원본 코드의 라인 리스트.
         diff_content (str): 적용할 diff의 내용 (unified diff format).
 
     Returns:
-        str | None: diff 적용이 성공한 경우, 수정된 전체 코드 문자열을 반환합니다.
-                    실패(컨텍스트 불일치 등)한 경우, None을 반환합니다.
+        list[str] | None: diff 적용이 성공한 경우, 수정된 전체 코드의 라인 리스트를 반환합니다.
+                          실패(컨텍스트 불일치 등)한 경우, None을 반환합니다.
     """
-    source_lines = source_code.split('\n')
-    diff_lines = diff_content.split('\n')
-
-    if not diff_lines:
-        return source_code
-
-    if not diff_lines[0].startswith("@@"):
-        if all(line.startswith('+') or not line.strip() for line in diff_lines):
-            code_to_add = [line[1:] for line in diff_lines if line.startswith('+')]
-            return "\n".join(source_lines + code_to_add)
-        else:
-            print_error(f"알 수 없는 diff 형식입니다 (헤더 없음): {diff_lines[0]}")
-            return None
+    if not diff_content.startswith("@@"):
+        # 헤더 없이 '+' 라인(과 공백 라인)만으로 이루어진 '추가 전용' diff입니다.
+        # 모든 라인이 '+'로 시작하는 경우(모든 '\n' 뒤에 '+'가 오는 경우)에는
+        # '\n+' 기준의 split 한 번으로 접두어가 제거된 라인들을 C 레벨에서 바로 얻습니다.
+        if diff_content.startswith('+') and diff_content.count('\n') == diff_content.count('\n+'):
+            return source_lines + diff_content[1:].split('\n+')
+
+        # 공백 라인이 섞여 있거나 형식이 잘못된 경우에는, 형식 검사와 추가할 라인 수집을
+        # 한 번의 순회로 함께 처리합니다.
+        diff_lines = diff_content.split('\n')
+        code_to_add = []
+        for line in diff_lines:
+            if line.startswith('+'):
+                code_to_add.append(line[1:])
+            elif line and not line.isspace():
+                # strip()으로 새 문자열을 만들지 않고, 공백으로만 이루어진 라인인지 바로 검사합니다.
+                print_error(f"알 수 없는 diff 형식입니다 (헤더 없음): {diff_lines[0]}")
+                return None
+        return source_lines + code_to_add
 
     result_lines = []
     last_source_line_processed = 0
 
-    hunk_indices = [i for i, line in enumerate(diff_lines) if line.startswith("@@")]
-    
-    for i, start_index in enumerate(hunk_indices):
-        hunk_header = diff_lines[start_index]
-        end_index = hunk_indices[i + 1] if i + 1 < len(hunk_indices) else len(diff_lines)
-        hunk_body = diff_lines[start_index + 1:end_index]
-        
-        match = re.match(r"@@ -(\d+),?(\d*) \+(\d+),?(\d*)", hunk_header.strip())
+    for hunk_header, hunk_body in _iter_hunks(diff_content):
+        # hunk 헤더는 항상 '@@'로 시작하며(_iter_hunks 참고), match()는 문자열 앞부분만
+        # 검사하므로 별도의 strip() 없이 바로 매칭합니다.
+        match = _HUNK_HEADER_RE.match(hunk_header)
         if not match:
             print_error(f"diff 헤더를 파싱할 수 없습니다: {hunk_header}")
             return None
         
         try:
             old_start = int(match.group(1))
+            # 헤더에 길이가 생략된 경우('@@ -5 +5 @@')는 1줄짜리 hunk를 의미합니다.
+            old_count = int(match.group(2) or 1)
         except (ValueError, IndexError) as e:
             print_error(f"diff 헤더 숫자 변환 중 오류 발생: {e} | 헤더: {hunk_header}")
             return None
 
+        # hunk가 원본 코드의 끝을 넘어서는 경우, 라인별 비교를 시작하기 전에 바로 실패 처리합니다.
+        if old_start - 1 + old_count > len(source_lines):
+            print_error(f"diff 범위가 원본 코드의 길이({len(source_lines)}줄)를 벗어납니다: {hunk_header}")
+            return None
+
         if old_start > 0 and old_start - 1 > last_source_line_processed:
              result_lines.extend(source_lines[last_source_line_processed:old_start - 1])
         
         source_pointer = old_start - 1 if old_start > 0 else 0
         
+        # hunk 본문을 연산자(op)와 내용(content)의 두 병렬 리스트로 나눕니다. 빈 라인은 무시합니다.
+        ops = []
+        contents = []
         for line in hunk_body:
             if not line: continue
-            
-            op, line_content = line[0], line[1:]
-            
-            if op == ' ':
-                if source_pointer >= len(source_lines) or source_lines[source_pointer] != line_content:
-                    print_error("치명적 오류: 컨텍스트 불일치 발생!")
-                    print(f"             - 예상된 소스({source_pointer+1}): '{line_content}'")
-                    print(f"             - 실제 소스({source_pointer+1}): '{source_lines[source_pointer] if source_pointer < len(source_lines) else 'EOF'}'")
+            ops.append(line[0])
+            contents.append(line[1:])
+
+        # 같은 연산자가 연속되는 구간(run) 단위로 처리합니다.
+        # 구간의 경계는 연산자 문자열에 대한 컴파일된 정규식(_OP_RUN_RE)이 C 레벨에서 찾아주므로,
+        # 파이썬 루프는 라인마다가 아니라 구간마다 한 번만 실행됩니다.
+        # 컨텍스트/삭제 구간은 슬라이스 비교 한 번으로 검증하여, 라인별 비교 루프를
+        # 파이썬 바이트코드가 아닌 C 레벨의 리스트 비교로 수행합니다.
+        for op_run in _OP_RUN_RE.finditer("".join(ops)):
+            run_start, run_end = op_run.span()
+            op = ops[run_start]
+            run = contents[run_start:run_end]
+
+            if op == ' ' or op == '-':
+                if source_lines[source_pointer:source_pointer + len(run)] != run:
+                    kind = "컨텍스트" if op == ' ' else "삭제할 라인"
+                    _print_line_mismatch(kind, source_lines, source_pointer, run)
                     return None
-                result_lines.append(line_content)
-                source_pointer += 1
+                if op == ' ':
+                    result_lines.extend(run)
+                source_pointer += len(run)
             elif op == '+':
-                result_lines.append(line_content)
-            elif op == '-':
-                if source_pointer >= len(source_lines) or source_lines[source_pointer] != line_content:
-                    print_error("치명적 오류: 삭제할 라인 불일치 발생!")
-                    print(f"             - 예상된 소스({source_pointer+1}): '{line_content}'")
-                    print(f"             - 실제 소스({source_pointer+1}): '{source_lines[source_pointer] if source_pointer < len(source_lines) else 'EOF'}'")
-                    return None
-                source_pointer += 1
+                result_lines.extend(run)
             else:
-                print(f"[ WARNING ] 알 수 없는 diff 라인 형식 (무시): {line}")
+                for line_content in run:
+                    print_warning(f"알 수 없는 diff 라인 형식 (무시): {op}{line_content}")
 
         last_source_line_processed = source_pointer
 
     if last_source_line_processed < len(source_lines):
         result_lines.extend(source_lines[last_source_line_processed:])
     
-    return "\n".join(result_lines)
+    return result_lines
+
+
+def apply_single_diff_robust(source_code: str, diff_content: str) -> str | None:
+    """
+    단일 diff 덩어리(patch)를 문자열 형태의 원본 소스 코드에 적용합니다.
+
+    실제 처리는 `_apply_single_diff_lines`가 담당하며, 이 함수는 문자열 입출력이
+    필요한 호출자를 위해 라인 분리와 결합만 수행합니다.
+
+    Args:
+        source_code (str): diff를 적용할 원본 코드.
+        diff_content (str): 적용할 diff의 내용 (unified diff format).
+
+    Returns:
+        str | None: diff 적용이 성공한 경우, 수정된 전체 코드 문자열을 반환합니다.
+                    실패(컨텍스트 불일치 등)한 경우, None을 반환합니다.
+    """
+    result_lines = _apply_single_diff_lines(source_code.split('\n'), diff_content)
+    return "\n".join(result_lines) if result_lines is not None else None
 
 
-def apply_all_diffs(initial_code: str, diffs: list[str]) -> str | None:
+def apply_all_diffs(initial_lines: list[str], diffs: Iterable[str], quiet: bool = False) -> list[str] | None:
     """
     초기 코드에 모든 diff들을 순차적으로 적용합니다.
 
+    초기 코드는 `parse_log_file`에서 이미 라인 리스트로 분리된 상태로 전달되며, 모든 diff는
+    이 리스트를 이어받아 적용됩니다. 최종 문자열 결합은 호출자(`restore_code_from_log`)가
+    한 번만 수행합니다.
+
     이 함수는 각 diff 적용 시 진행 상황을 CLI에 출력합니다.
+    quiet가 True이면 패치별 진행 메시지 대신, 모든 적용이 끝난 뒤 요약 한 줄만 출력합니다.
     Args:
-        initial_code (str): 복원의 기준이 될 초기 코드.
-        diffs (list[str]): 순서대로 적용할 diff들의 리스트.
+        initial_lines (list[str]): 복원의 기준이 될 초기 코드의 라인 리스트.
+        diffs (Iterable[str]): 순서대로 적용할 diff들 (리스트 또는 `parse_log_stream`의 이터레이터).
+        quiet (bool): 패치별 진행 메시지를 생략할지 여부.
 
     Returns:
-        str | None: 모든 diff가 성공적으로 적용된 최종 코드.
-                    중간에 하나라도 실패하면 None을 반환합니다.
+        list[str] | None: 모든 diff가 성공적으로 적용된 최종 코드의 라인 리스트.
+                          중간에 하나라도 실패하면 None을 반환합니다.
     """
-    current_code = initial_code
-    for i, diff_text in enumerate(diffs, 1):
-        next_code_version = apply_single_diff_robust(current_code, diff_text)
-        
-        if next_code_version is None:
-             print_error(f"패치 #{i}를 적용하는 데 실패했습니다. 복원을 중단합니다.")
-             return None
-        
-        current_code = next_code_version
-        print_progress(f"패치 #{i} 적용 완료.")
-        
-    return current_code
+    # 각 diff의 hunk 헤더 줄 번호와 컨텍스트 라인은 '직전 diff가 적용된 결과'를 기준으로 기록되어 있으므로,
+    # diff들을 나누어 병렬로 적용할 수 없습니다. (중간 스냅샷을 만들려면 결국 앞의 diff들을 모두
+    # 순차 적용해야 합니다.) 따라서 적용은 항상 기록된 순서대로 하나씩 진행합니다.
+    current_lines = initial_lines
+    applied_count = 0
+    try:
+        for i, diff_text in enumerate(diffs, 1):
+            next_lines = _apply_single_diff_lines(current_lines, diff_text)
+            
+            if next_lines is None:
+                 print_error(f"패치 #{i}를 적용하는 데 실패했습니다. 복원을 중단합니다.")
+                 return None
+            
+            current_lines = next_lines
+            applied_count = i
+            if not quiet:
+                print_progress(f"패치 #{i} 적용 완료.")
+    finally:
+        # 아직 출력되지 않고 모여 있는 진행 메시지를 모두 내보냅니다.
+        _flush_progress()
+
+    if quiet:
+        print_ok(f"총 {applied_count}개의 패치를 적용했습니다.")
+    return current_lines
+
+def _read_log_file(log_file_path: str) -> tuple[str, bytes]:
+    """
+    로그 파일 전체를 메모리 매핑(mmap)으로 읽어 줄바꿈이 LF(\n)로 통일된 문자열로 반환합니다.
+
+    파일을 mmap으로 열어 힙에 별도의 바이트 사본을 만들지 않고 바로 디코딩합니다.
+    CR(\r)이 전혀 없는 일반적인(LF 전용) 로그에서는 줄바꿈 변환용 사본도 생기지 않습니다.
+    mmap은 내용이 있는 일반 파일에만 사용하며, 파이프나 프로세스 치환(`<(...)`),
+    /dev/stdin처럼 크기가 0으로 보고되는 입력은 일반적인 read()로 읽습니다.
+
+    Args:
+        log_file_path (str): 읽을 로그 파일의 경로.
 
-def restore_code_from_log(log_file_path: str, output_file_path: str) -> None:
+    파싱 결과 캐시의 키로 쓰이는 해시(BLAKE2b)도 여기서 원본 바이트(mmap 버퍼)에 대해
+    바로 계산하므로, 해시를 위해 로그 전체를 다시 인코딩한 사본을 만들 필요가 없습니다.
+
+    Returns:
+        tuple[str, bytes]: UTF-8로 디코딩되고 줄바꿈이 통일된 로그 파일의 전체 내용과,
+                           원본 바이트의 16바이트 해시.
+    """
+    with open(log_file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                log_content = str(mm, 'utf-8')
+                has_cr = mm.find(b'\r') != -1
+                content_key = hashlib.blake2b(mm, digest_size=16).digest()
+        else:
+            # 빈 파일과 일반 파일이 아닌 입력은 mmap으로 매핑할 수 없으므로 끝까지 읽어들입니다.
+            data = f.read()
+            log_content = data.decode('utf-8')
+            has_cr = b'\r' in data
+            content_key = hashlib.blake2b(data, digest_size=16).digest()
+
+    # [최종 안정성 수정]
+    # 모든 종류의 줄바꿈(CRLF, CR, LF)을 표준 LF(\n)으로 통일합니다.
+    # 이것으로 모든 후속 처리(split, join)에서 발생하는 혼란을 원천 차단합니다.
+    # 이 정규화 덕분에 이후의 모든 라인 분리는 splitlines() 대신 더 빠른 split('\n')으로
+    # 통일해도 안전합니다. (splitlines()는 \x0b, \x1c, \u2028 등도 줄바꿈으로 취급하여
+    # 소스 코드 내용을 훼손할 수 있습니다.)
+    if has_cr:
+        log_content = log_content.replace('\r\n', '\n').replace('\r', '\n')
+    return log_content, content_key
+
+def _iter_log_file_lines(log_file_path: str) -> Iterator[str]:
+    """
+    로그 파일을 텍스트 모드로 열어 라인을 하나씩 생성하고, 모두 읽으면 파일을 닫습니다.
+
+    텍스트 모드의 기본 줄바꿈 처리(universal newlines)가 CRLF와 CR을 LF(\n)로 통일하므로,
+    `_read_log_file`과 같은 정규화가 라인 단위로 이루어집니다.
+    """
+    with open(log_file_path, 'r', encoding='utf-8') as f:
+        yield from f
+
+def _write_output_file(output_file_path: str, content: str) -> None:
+    """
+    복원된 코드를 한 번에 UTF-8로 인코딩하여 파일 디스크립터에 직접 기록합니다.
+
+    텍스트 모드 파일 객체의 점진적 인코더와 버퍼링 계층을 거치지 않으므로,
+    큰 결과물도 인코딩 한 번과 (대부분의 경우) write 시스템 콜 한 번으로 저장됩니다.
+    줄바꿈은 텍스트 모드와 동일하게 플랫폼 기본값(os.linesep)으로 기록합니다.
+
+    Args:
+        output_file_path (str): 결과를 저장할 파일의 경로.
+        content (str): 저장할 내용 (줄바꿈은 LF로 통일된 상태).
+
+    Raises:
+        OSError: 파일을 열거나 쓰는 중 문제가 발생한 경우.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(output_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        # os.write는 요청한 크기보다 적게 기록할 수 있으므로, 남은 부분이 없을 때까지 반복합니다.
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _load_log(log_file_path: str) -> tuple[list[str], Iterable[str], int | None] | None:
+    """
+    로그 파일을 읽고 파싱하여 초기 코드와 diff들을 반환합니다.
+
+    크기가 `_STREAMING_THRESHOLD_BYTES` 이상인 로그는 `parse_log_stream`으로 스트리밍하며,
+    이때 diff들은 이터레이터로 반환되고 개수는 미리 알 수 없으므로 None입니다.
+    그보다 작은 로그는 `_read_log_file`로 한 번에 읽어 캐시된 파싱 결과를 사용합니다.
+
+    Args:
+        log_file_path (str): 읽을 로그 파일의 경로.
+
+    Returns:
+        성공 시:
+            tuple[list[str], Iterable[str], int | None]: 라인 단위로 분리된 초기 코드,
+                순서대로 적용할 diff들, diff의 개수(스트리밍 모드에서는 None).
+        실패 시 (초기 버전 블록을 찾지 못한 경우):
+            None.
+
+    Raises:
+        OSError, UnicodeDecodeError: 로그 파일을 읽는 중 문제가 발생한 경우.
+        LogFormatError: 로그의 블록 형식이 잘못된 경우.
+    """
+    if os.path.getsize(log_file_path) >= _STREAMING_THRESHOLD_BYTES:
+        initial_code_lines, diff_iter = parse_log_stream(_iter_log_file_lines(log_file_path))
+        if initial_code_lines is None or diff_iter is None:
+            return None
+        return initial_code_lines, diff_iter, None
+
+    log_content, content_key = _read_log_file(log_file_path)
+    initial_code_lines, diff_list = _parse_log_file_cached(log_content, content_key)
+    if initial_code_lines is None or diff_list is None:
+        return None
+    return initial_code_lines, diff_list, len(diff_list)
+
+def restore_code_from_log(log_file_path: str, output_file_path: str, quiet: bool = False) -> None:
     """
     스크립트의 메인 로직을 수행하는 최상위 함수.
     전체 복원 과정을 조율하고 모든 사용자 대상 CLI 출력을 관리합니다.
+    quiet가 True이면 패치별 진행 메시지를 생략합니다 (`apply_all_diffs` 참고).
     """
     # --- 시작 정보 출력 ---
     print_info(f"코드 복원 프로세스 (v4.4)를 시작합니다...")
@@ -214,41 +627,55 @@ def restore_code_from_log(log_file_path: str, output_file_path: str) -> None:
     # --- STEP 1: 파일 읽기 및 파싱 ---
     print_step("1  ] 로그 파일에서 초기 코드와 변경 기록을 파싱합니다...")
     try:
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            # [최종 안정성 수정]
-            # 모든 종류의 줄바꿈(CRLF, LF)을 표준 LF(\n)으로 통일합니다.
-            # 이것으로 모든 후속 처리(split, join)에서 발생하는 혼란을 원천 차단합니다.
-            log_content = f.read().replace('\r\n', '\n')
+        loaded_log = _load_log(log_file_path)
+    except LogFormatError as e:
+        print_error(f"로그 파일 형식 오류: {e}")
+        print_failed(f"'{os.path.basename(log_file_path)}' 처리 중단.")
+        return
     except Exception as e:
         print_error(f"로그 파일을 읽는 중 문제가 발생했습니다: {e}")
         return
-        
-    initial_code_content, diff_list = parse_log_file(log_content)
 
-    # 파싱 결과 유효성 검사. (None, None)을 반환했다면 복원을 진행할 수 없습니다.
-    # 이 '타입 가드'를 통해 이 블록 아래에서는 두 변수가 None이 아님이 보장됩니다.
-    if initial_code_content is None or diff_list is None:
+    # 파싱 결과 유효성 검사. None을 반환했다면 복원을 진행할 수 없습니다.
+    # 이 '타입 가드'를 통해 이 블록 아래에서는 세 변수의 타입이 보장됩니다.
+    if loaded_log is None:
         print_error("'Initial version' 블록을 찾지 못해 파싱에 실패했습니다.")
         print_failed(f"'{os.path.basename(log_file_path)}' 처리 중단.")
         return
+    initial_code_lines, diffs, diff_count = loaded_log
     
     print_ok("초기 버전 코드를 성공적으로 추출했습니다.")
-    print_ok(f"총 {len(diff_list)}개의 변경 기록(diff)을 찾았습니다.")
+    if diff_count is None:
+        print_ok("변경 기록(diff)은 로그를 읽으면서 하나씩 적용합니다 (스트리밍 모드).")
+    else:
+        print_ok(f"총 {diff_count}개의 변경 기록(diff)을 찾았습니다.")
 
     # --- STEP 2: Diff 적용 ---
     print_step("2  ] 초기 코드에 변경 기록을 순차적으로 적용합니다...")
-    final_code = apply_all_diffs(initial_code_content, diff_list)
+    try:
+        final_lines = apply_all_diffs(initial_code_lines, diffs, quiet=quiet)
+    except (OSError, UnicodeDecodeError) as e:
+        # 스트리밍 모드에서는 이 단계에서도 로그 파일을 읽으므로, 읽기 오류가 여기서 발생할 수 있습니다.
+        print_error(f"로그 파일을 읽는 중 문제가 발생했습니다: {e}")
+        final_lines = None
+    except LogFormatError as e:
+        # 스트리밍 모드에서는 초기 버전 이후의 블록 형식 오류도 이 단계에서 발견됩니다.
+        print_error(f"로그 파일 형식 오류: {e}")
+        final_lines = None
 
     # Diff 적용 중 하나라도 실패하면(None 반환) 프로세스를 중단합니다.
-    if final_code is None:
+    if final_lines is None:
         print_failed(f"'{os.path.basename(log_file_path)}' 처리 중 치명적 오류 발생.")
         return
+    # 라인 리스트는 모든 패치 적용이 끝난 뒤 여기서 단 한 번만 문자열로 결합합니다.
+    final_code = "\n".join(final_lines)
 
     # --- STEP 3: 결과 저장 ---
     print_step(f"3  ] '{output_file_path}' 파일에 결과를 저장합니다...")
     output_dir = os.path.dirname(output_file_path)
     # 출력 경로의 디렉터리가 존재하지 않는 경우, 안전하게 생성합니다.
-    if output_dir and not os.path.exists(output_dir):
+    # exist_ok=True이므로 별도의 존재 여부 확인(stat) 없이 바로 호출해도 됩니다.
+    if output_dir:
         try:
             os.makedirs(output_dir, exist_ok=True)
         except OSError as e:
@@ -260,8 +687,7 @@ def restore_code_from_log(log_file_path: str, output_file_path: str) -> None:
         # [최종 출력 표준화]
         standardized_final_code = final_code.rstrip() + '\n'
 
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(standardized_final_code)
+        _write_output_file(output_file_path, standardized_final_code)
         print_success(f"최종 복원된 코드를 '{os.path.abspath(output_file_path)}' 파일로 저장했습니다.")
     except IOError as e:
         print_error(f"최종 코드를 파일에 쓰는 중 문제가 발생했습니다: {e}")
@@ -277,9 +703,12 @@ if __name__ == "__main__":
     # 필수 위치 인자(Positional Argument) 2개를 정의합니다.
     parser.add_argument('log_file', help='복원할 개발 과정 로그 파일의 경로입니다.')
     parser.add_argument('output_file', help='최종 복원된 코드를 저장할 파일의 경로입니다.')
+    # 선택 인자: 패치가 많은 로그에서 패치별 진행 메시지를 생략합니다.
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='패치별 진행 메시지를 생략하고, 적용한 패치 수만 요약하여 출력합니다.')
 
     # sys.argv로부터 인자를 파싱합니다. 잘못된 인자가 들어오면 자동으로 도움말을 보여주고 종료됩니다.
     args = parser.parse_args()
     
     # 파싱된 인자를 사용하여 메인 복원 함수를 호출합니다.
-    restore_code_from_log(args.log_file, args.output_file)
\ No newline at end of file
+    restore_code_from_log(args.log_file, args.output_file, quiet=args.quiet)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import io
+import unittest
+
+from mission_restore.main import LogFormatError, parse_log_file, parse_log_stream
+
+
+INITIAL = "🦊=== Initial version of app.py ===\n"
+CHANGES = "🦊=== Code changes at 2024-01-01 00:00:00 ===\n"
+DIFF_HEADER = "--- previous version\n+++ current version\n"
+
+
+def parse_stream_fully(log_content: str):
+    """parse_log_stream의 결과를 parse_log_file과 비교할 수 있도록 diff 이터레이터를 리스트로 풀어냅니다."""
+    initial_code_lines, diffs = parse_log_stream(io.StringIO(log_content))
+    return initial_code_lines, (list(diffs) if diffs is not None else None)
+
+
+class ParseLogStreamMatchesParseLogFileTest(unittest.TestCase):
+    """스트리밍 파서(parse_log_stream)가 일반 파서(parse_log_file)와 같은 결과를 내는지 검증합니다."""
+
+    def assert_parsers_agree(self, log_content: str):
+        expected = parse_log_file(log_content)
+        self.assertEqual(parse_stream_fully(log_content), expected)
+        return expected
+
+    def test_marker_at_start(self):
+        log = (INITIAL + "x = 1\ny = 2\n"
+               + CHANGES + DIFF_HEADER + "@@ -1 +1 @@\n-x = 1\n+x = 2\n")
+        initial_code_lines, diffs = self.assert_parsers_agree(log)
+        self.assertEqual(initial_code_lines, ["x = 1", "y = 2"])
+        self.assertEqual(diffs, ["@@ -1 +1 @@\n-x = 1\n+x = 2"])
+
+    def test_marker_in_middle_after_preamble(self):
+        log = ("preamble line\nanother line\n" + INITIAL + "x = 1\n"
+               + CHANGES + DIFF_HEADER + "+y = 2\n")
+        initial_code_lines, diffs = self.assert_parsers_agree(log)
+        self.assertEqual(initial_code_lines, ["x = 1"])
+        self.assertEqual(diffs, ["+y = 2"])
+
+    def test_trailing_newline_variants(self):
+        body = INITIAL + "x = 1\n" + CHANGES + DIFF_HEADER + "+y = 2"
+        for suffix in ("", "\n", "\n\n", "\n\n\n"):
+            with self.subTest(suffix=suffix):
+                self.assert_parsers_agree(body + suffix)
+
+    def test_blank_lines_between_blocks(self):
+        log = (INITIAL + "x = 1\n\n"
+               + CHANGES + DIFF_HEADER + "@@ -1 +1 @@\n-x = 1\n+x = 2\n\n"
+               + CHANGES + DIFF_HEADER + "+z = 3\n\n")
+        self.assert_parsers_agree(log)
+
+    def test_diffs_before_initial_block(self):
+        log = (CHANGES + DIFF_HEADER + "+early\n"
+               + INITIAL + "x = 1\n"
+               + CHANGES + DIFF_HEADER + "+late\n")
+        initial_code_lines, diffs = self.assert_parsers_agree(log)
+        self.assertEqual(initial_code_lines, ["x = 1"])
+        self.assertEqual(diffs, ["+early", "+late"])
+
+    def test_empty_diff(self):
+        log = (INITIAL + "x = 1\n"
+               + CHANGES + DIFF_HEADER
+               + CHANGES + DIFF_HEADER.rstrip("\n"))
+        initial_code_lines, diffs = self.assert_parsers_agree(log)
+        self.assertEqual(diffs, ["", ""])
+
+    def test_header_only_initial_block(self):
+        for log in (INITIAL.rstrip("\n"), INITIAL, INITIAL + "\n\nx = 1\n"):
+            with self.subTest(log=log):
+                self.assert_parsers_agree(log)
+
+    def test_diff_header_with_trailing_whitespace(self):
+        log = (INITIAL + "x = 1\n"
+               + CHANGES + "--- previous version \n+++ current version\t\n"
+               + "@@ -1 +1 @@\n-x = 1\n+x = 2\n")
+        _, diffs = self.assert_parsers_agree(log)
+        self.assertEqual(diffs, ["@@ -1 +1 @@\n-x = 1\n+x = 2"])
+
+    def test_missing_initial_block(self):
+        for log in ("", "no header here\n", CHANGES + DIFF_HEADER + "+x\n"):
+            with self.subTest(log=log):
+                self.assertEqual(self.assert_parsers_agree(log), (None, None))
+
+    def test_missing_diff_header_is_an_error(self):
+        log = INITIAL + "x = 1\n" + CHANGES + "@@ -1 +1 @@\n-x = 1\n+x = 2\n"
+        with self.assertRaises(LogFormatError):
+            parse_log_file(log)
+        with self.assertRaises(LogFormatError):
+            parse_stream_fully(log)
+
+
+if __name__ == "__main__":
+    unittest.main()